@@ -30,9 +30,7 @@ from idaes.apps.caprese.tests.test_simple_model import make_model
 __author__ = "Robert Parker"
 
 
-@pytest.mark.unit
-def test_categorize_deriv():
-    """The simplest test. Identify a differential and a derivative var."""
+def _make_deriv_model():
     m = pyo.ConcreteModel()
     m.time = dae.ContinuousSet(initialize=[0, 1])
     m.v = pyo.Var(m.time, initialize=0)
@@ -40,6 +38,101 @@ def test_categorize_deriv():
     m.diff_eqn = pyo.Constraint(
         m.time, rule={t: m.dv[t] == -m.v[t] ** 2 for t in m.time}
     )
+    return m
+
+
+@pytest.fixture(scope="module")
+def discretized_deriv_model():
+    """Discretized single-derivative model, shared by the tests below.
+    Tests that fix or deactivate components should work on a clone.
+    """
+    m = _make_deriv_model()
+    disc = pyo.TransformationFactory("dae.finite_difference")
+    disc.apply_to(m, wrt=m.time, nfe=1, scheme="BACKWARD")
+    return m
+
+
+@pytest.fixture(scope="module")
+def simple_model_template():
+    """A freshly constructed "simple model". This is never modified;
+    tests should work on a clone.
+    """
+    return make_model()
+
+
+@pytest.fixture(scope="module")
+def simple_model(simple_model_template):
+    """The "simple model" with inputs unfixed, along with its flattened
+    time-indexed variables and constraints.
+    """
+    m = simple_model_template.clone()
+    m.conc_in.unfix()
+    m.flow_in.unfix()
+    scalar_vars, dae_vars = flatten_dae_components(m, m.time, pyo.Var)
+    scalar_cons, dae_cons = flatten_dae_components(m, m.time, pyo.Constraint)
+    return m, dae_vars, dae_cons
+
+
+def _id_set(components):
+    return frozenset(id(comp) for comp in components)
+
+
+@pytest.fixture(scope="module")
+def simple_model_expected(simple_model):
+    """Expected partition of the simple model at the second time point,
+    stored as sets of component ids.
+    """
+    m, dae_vars, dae_cons = simple_model
+    t1 = m.time.at(2)
+    # Expected variables:
+    expected_vars = {
+        VC.DIFFERENTIAL: _id_set([m.conc[t1, "A"], m.conc[t1, "B"]]),
+        VC.DERIVATIVE: _id_set([m.dcdt[t1, "A"], m.dcdt[t1, "B"]]),
+        VC.ALGEBRAIC: _id_set(
+            [
+                m.rate[t1, "A"],
+                m.rate[t1, "B"],
+                m.flow_out[t1],
+            ]
+        ),
+        VC.INPUT: _id_set([m.flow_in[t1]]),
+        VC.DISTURBANCE: _id_set(
+            [
+                m.conc_in[t1, "A"],
+                m.conc_in[t1, "B"],
+            ]
+        ),
+    }
+
+    # Expected constraints:
+    expected_cons = {
+        CC.DIFFERENTIAL: _id_set(
+            [
+                m.material_balance[t1, "A"],
+                m.material_balance[t1, "B"],
+            ]
+        ),
+        CC.DISCRETIZATION: _id_set(
+            [
+                m.dcdt_disc_eq[t1, "A"],
+                m.dcdt_disc_eq[t1, "B"],
+            ]
+        ),
+        CC.ALGEBRAIC: _id_set(
+            [
+                m.rate_eqn[t1, "A"],
+                m.rate_eqn[t1, "B"],
+                m.flow_eqn[t1],
+            ]
+        ),
+    }
+    return t1, expected_vars, expected_cons
+
+
+@pytest.mark.unit
+def test_categorize_deriv(discretized_deriv_model):
+    """The simplest test. Identify a differential and a derivative var."""
+    m = _make_deriv_model()
     with pytest.raises(TypeError):
         # If we find a derivative var, we will try to access the disc eq.
         var_partition, con_partition = categorize_dae_variables_and_constraints(
@@ -48,8 +141,7 @@ def test_categorize_deriv():
             [m.diff_eqn],
             m.time,
         )
-    disc = pyo.TransformationFactory("dae.finite_difference")
-    disc.apply_to(m, wrt=m.time, nfe=1, scheme="BACKWARD")
+    m = discretized_deriv_model
     var_partition, con_partition = categorize_dae_variables_and_constraints(
         m,
         [m.v, m.dv],
@@ -65,36 +157,18 @@ def test_categorize_deriv():
     assert len(con_partition[CC.DISCRETIZATION]) == 1
     assert con_partition[CC.DISCRETIZATION][0] is m.dv_disc_eq
 
-    for categ in VC:
-        if (
-            categ is not VC.DIFFERENTIAL
-            and categ is not VC.DERIVATIVE
-            and categ in var_partition
-        ):
-            assert len(var_partition[categ]) == 0
-    for categ in CC:
-        if (
-            categ is not CC.DIFFERENTIAL
-            and categ is not CC.DISCRETIZATION
-            and categ in con_partition
-        ):
-            assert len(con_partition[categ]) == 0
+    for categ in set(var_partition) - {VC.DIFFERENTIAL, VC.DERIVATIVE}:
+        assert not var_partition[categ]
+    for categ in set(con_partition) - {CC.DIFFERENTIAL, CC.DISCRETIZATION}:
+        assert not con_partition[categ]
 
 
 @pytest.mark.unit
-def test_categorize_deriv_fixed():
+def test_categorize_deriv_fixed(discretized_deriv_model):
     """If one of the derivative or diff var are fixed, the other
     should be categorized as algebraic.
     """
-    m = pyo.ConcreteModel()
-    m.time = dae.ContinuousSet(initialize=[0, 1])
-    m.v = pyo.Var(m.time, initialize=0)
-    m.dv = dae.DerivativeVar(m.v, wrt=m.time)
-    m.diff_eqn = pyo.Constraint(
-        m.time, rule={t: m.dv[t] == -m.v[t] ** 2 for t in m.time}
-    )
-    disc = pyo.TransformationFactory("dae.finite_difference")
-    disc.apply_to(m, wrt=m.time, nfe=1, scheme="BACKWARD")
+    m = discretized_deriv_model.clone()
 
     #
     # Fix differential variable, e.g. it is an input
@@ -115,20 +189,10 @@ def test_categorize_deriv_fixed():
     assert con_partition[CC.ALGEBRAIC][0] is m.dv_disc_eq
 
     # Unexpected categories are empty
-    for categ in VC:
-        if (
-            categ is not VC.ALGEBRAIC
-            and categ is not VC.UNUSED
-            and categ in var_partition
-        ):
-            assert len(var_partition[categ]) == 0
-    for categ in CC:
-        if (
-            categ is not CC.ALGEBRAIC
-            and categ is not CC.UNUSED
-            and categ in con_partition
-        ):
-            assert len(con_partition[categ]) == 0
+    for categ in set(var_partition) - {VC.ALGEBRAIC, VC.UNUSED}:
+        assert not var_partition[categ]
+    for categ in set(con_partition) - {CC.ALGEBRAIC, CC.UNUSED}:
+        assert not con_partition[categ]
 
     #
     # We can accomplish something similar by making m.v an input
@@ -170,15 +234,11 @@ def test_categorize_deriv_fixed():
 
 
 @pytest.mark.unit
-def test_categorize_simple_model():
+def test_categorize_simple_model(simple_model, simple_model_expected):
     """Categorize variables and equations in the "simple model" used
     for the base class unit tests.
     """
-    m = make_model()
-    m.conc_in.unfix()
-    m.flow_in.unfix()
-    scalar_vars, dae_vars = flatten_dae_components(m, m.time, pyo.Var)
-    scalar_cons, dae_cons = flatten_dae_components(m, m.time, pyo.Constraint)
+    m, dae_vars, dae_cons = simple_model
     var_partition, con_partition = categorize_dae_variables_and_constraints(
         m,
         dae_vars,
@@ -190,55 +250,13 @@ def test_categorize_simple_model():
             pyo.Reference(m.conc_in[:, "B"]),
         ],
     )
-    t1 = m.time.at(2)
-    # Expected variables:
-    expected_vars = {
-        VC.DIFFERENTIAL: ComponentSet([m.conc[t1, "A"], m.conc[t1, "B"]]),
-        VC.DERIVATIVE: ComponentSet([m.dcdt[t1, "A"], m.dcdt[t1, "B"]]),
-        VC.ALGEBRAIC: ComponentSet(
-            [
-                m.rate[t1, "A"],
-                m.rate[t1, "B"],
-                m.flow_out[t1],
-            ]
-        ),
-        VC.INPUT: ComponentSet([m.flow_in[t1]]),
-        VC.DISTURBANCE: ComponentSet(
-            [
-                m.conc_in[t1, "A"],
-                m.conc_in[t1, "B"],
-            ]
-        ),
-    }
-
-    # Expected constraints:
-    expected_cons = {
-        CC.DIFFERENTIAL: ComponentSet(
-            [
-                m.material_balance[t1, "A"],
-                m.material_balance[t1, "B"],
-            ]
-        ),
-        CC.DISCRETIZATION: ComponentSet(
-            [
-                m.dcdt_disc_eq[t1, "A"],
-                m.dcdt_disc_eq[t1, "B"],
-            ]
-        ),
-        CC.ALGEBRAIC: ComponentSet(
-            [
-                m.rate_eqn[t1, "A"],
-                m.rate_eqn[t1, "B"],
-                m.flow_eqn[t1],
-            ]
-        ),
-    }
+    t1, expected_vars, expected_cons = simple_model_expected
 
     # Expected categories have expected variables and constraints
     for categ in expected_vars:
         assert len(expected_vars[categ]) == len(var_partition[categ])
         for var in var_partition[categ]:
-            assert var[t1] in expected_vars[categ]
+            assert id(var[t1]) in expected_vars[categ]
     for categ in var_partition:
         if categ not in expected_vars:
             assert len(var_partition[categ]) == 0
@@ -246,14 +264,14 @@ def test_categorize_simple_model():
     for categ in expected_cons:
         assert len(expected_cons[categ]) == len(con_partition[categ])
         for con in con_partition[categ]:
-            assert con[t1] in expected_cons[categ]
+            assert id(con[t1]) in expected_cons[categ]
     for categ in con_partition:
         if categ not in expected_cons:
             assert len(con_partition[categ]) == 0
 
 
 @pytest.mark.unit
-def test_categorize_simple_model_with_constraints():
+def test_categorize_simple_model_with_constraints(simple_model_template):
     """Categorize variables and equations in the "simple model" used
     for the base class unit tests, now with an "input constraint"
     and an active inequality.
@@ -262,7 +280,7 @@ def test_categorize_simple_model_with_constraints():
     so that var must be matched with the inequality and therefore
     must be "considered differential."
     """
-    m = make_model()
+    m = simple_model_template.clone()
     m.conc_in.unfix()
     m.flow_in.unfix()
     m.performance = pyo.Constraint(
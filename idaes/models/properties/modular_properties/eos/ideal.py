@@ -23,7 +23,7 @@ Currently only supports liquid and vapor phases
 
 from pyomo.environ import Expression, log
 
-from idaes.core import Apparent
+from idaes.core import Apparent, PhaseType as PT
 from idaes.core.util.exceptions import ConfigurationError, PropertyNotSupportedError
 from idaes.models.properties.modular_properties.base.utility import (
     get_method,
@@ -83,8 +83,8 @@ class Ideal(EoSBase):
 
     @staticmethod
     def compress_fact_phase(b, p):
-        pobj = b.params.get_phase(p)
-        if pobj.is_vapor_phase():
+        ptype = _phase_type(b, p)
+        if ptype == PT.vaporPhase:
             return 1
         else:
             return 0
@@ -95,19 +95,19 @@ class Ideal(EoSBase):
 
     @staticmethod
     def cp_mol_phase(b, p):
+        x = b.get_mole_frac(p)
         return sum(
-            b.get_mole_frac(p)[p, j] * b.cp_mol_phase_comp[p, j]
-            for j in b.components_in_phase(p)
+            x[p, j] * b.cp_mol_phase_comp[p, j] for j in b.components_in_phase(p)
         )
 
     @staticmethod
     def cp_mol_phase_comp(b, p, j):
-        pobj = b.params.get_phase(p)
-        if pobj.is_vapor_phase():
+        ptype = _phase_type(b, p)
+        if ptype == PT.vaporPhase:
             return get_method(b, "cp_mol_ig_comp", j)(b, cobj(b, j), b.temperature)
-        elif pobj.is_liquid_phase():
+        elif ptype == PT.liquidPhase:
             return get_method(b, "cp_mol_liq_comp", j)(b, cobj(b, j), b.temperature)
-        elif pobj.is_solid_phase():
+        elif ptype == PT.solidPhase:
             return get_method(b, "cp_mol_sol_comp", j)(b, cobj(b, j), b.temperature)
         else:
             raise PropertyNotSupportedError(_invalid_phase_msg(b.name, p))
@@ -118,17 +118,17 @@ class Ideal(EoSBase):
 
     @staticmethod
     def cv_mol_phase(b, p):
+        x = b.get_mole_frac(p)
         return sum(
-            b.get_mole_frac(p)[p, j] * b.cv_mol_phase_comp[p, j]
-            for j in b.components_in_phase(p)
+            x[p, j] * b.cv_mol_phase_comp[p, j] for j in b.components_in_phase(p)
         )
 
     @staticmethod
     def cv_mol_phase_comp(b, p, j):
-        pobj = b.params.get_phase(p)
-        if pobj.is_vapor_phase():
+        ptype = _phase_type(b, p)
+        if ptype == PT.vaporPhase:
             return EoSBase.cv_mol_ig_comp_pure(b, j)
-        elif pobj.is_liquid_phase() or pobj.is_solid_phase():
+        elif ptype in (PT.liquidPhase, PT.solidPhase):
             return EoSBase.cv_mol_ls_comp_pure(b, p, j)
         else:
             raise PropertyNotSupportedError(_invalid_phase_msg(b.name, p))
@@ -139,41 +139,42 @@ class Ideal(EoSBase):
 
     @staticmethod
     def dens_mol_phase(b, p):
-        pobj = b.params.get_phase(p)
-        if pobj.is_vapor_phase():
+        ptype = _phase_type(b, p)
+        if ptype == PT.vaporPhase:
             return b.pressure / (Ideal.gas_constant(b) * b.temperature)
         else:
             return 1 / b.vol_mol_phase[p]
 
     @staticmethod
     def energy_internal_mol_phase(b, p):
+        x = b.get_mole_frac(p)
         return sum(
-            b.get_mole_frac(p)[p, j] * b.energy_internal_mol_phase_comp[p, j]
+            x[p, j] * b.energy_internal_mol_phase_comp[p, j]
             for j in b.components_in_phase(p)
         )
 
     @staticmethod
     def energy_internal_mol_phase_comp(b, p, j):
-        pobj = b.params.get_phase(p)
-        if pobj.is_vapor_phase():
+        ptype = _phase_type(b, p)
+        if ptype == PT.vaporPhase:
             return EoSBase.energy_internal_mol_ig_comp_pure(b, j)
-        elif pobj.is_liquid_phase() or pobj.is_solid_phase():
+        elif ptype in (PT.liquidPhase, PT.solidPhase):
             return EoSBase.energy_internal_mol_ls_comp_pure(b, p, j)
         else:
             raise PropertyNotSupportedError(_invalid_phase_msg(b.name, p))
 
     @staticmethod
     def enth_mol_phase(b, p):
-        pobj = b.params.get_phase(p)
-        if pobj.is_vapor_phase():
+        ptype = _phase_type(b, p)
+        x = b.get_mole_frac(p)
+        if ptype == PT.vaporPhase:
             return sum(
-                b.get_mole_frac(p)[p, j] * b.enth_mol_phase_comp[p, j]
-                for j in b.components_in_phase(p)
+                x[p, j] * b.enth_mol_phase_comp[p, j] for j in b.components_in_phase(p)
             )
-        elif pobj.is_liquid_phase():
+        elif ptype == PT.liquidPhase:
             return (
                 sum(
-                    b.get_mole_frac(p)[p, j]
+                    x[p, j]
                     * get_method(b, "enth_mol_liq_comp", j)(
                         b, cobj(b, j), b.temperature
                     )
@@ -181,10 +182,10 @@ class Ideal(EoSBase):
                 )
                 + (b.pressure - b.params.pressure_ref) / b.dens_mol_phase[p]
             )
-        elif pobj.is_solid_phase():
+        elif ptype == PT.solidPhase:
             return (
                 sum(
-                    b.get_mole_frac(p)[p, j]
+                    x[p, j]
                     * get_method(b, "enth_mol_sol_comp", j)(
                         b, cobj(b, j), b.temperature
                     )
@@ -197,15 +198,15 @@ class Ideal(EoSBase):
 
     @staticmethod
     def enth_mol_phase_comp(b, p, j):
-        pobj = b.params.get_phase(p)
-        if pobj.is_vapor_phase():
+        ptype = _phase_type(b, p)
+        if ptype == PT.vaporPhase:
             return get_method(b, "enth_mol_ig_comp", j)(b, cobj(b, j), b.temperature)
-        elif pobj.is_liquid_phase():
+        elif ptype == PT.liquidPhase:
             return (
                 get_method(b, "enth_mol_liq_comp", j)(b, cobj(b, j), b.temperature)
                 + (b.pressure - b.params.pressure_ref) / b.dens_mol_phase[p]
             )
-        elif pobj.is_solid_phase():
+        elif ptype == PT.solidPhase:
             return (
                 get_method(b, "enth_mol_sol_comp", j)(b, cobj(b, j), b.temperature)
                 + (b.pressure - b.params.pressure_ref) / b.dens_mol_phase[p]
@@ -215,24 +216,24 @@ class Ideal(EoSBase):
 
     @staticmethod
     def entr_mol_phase(b, p):
+        x = b.get_mole_frac(p)
         return sum(
-            b.get_mole_frac(p)[p, j] * b.entr_mol_phase_comp[p, j]
-            for j in b.components_in_phase(p)
+            x[p, j] * b.entr_mol_phase_comp[p, j] for j in b.components_in_phase(p)
         )
 
     @staticmethod
     def entr_mol_phase_comp(b, p, j):
-        pobj = b.params.get_phase(p)
-        if pobj.is_vapor_phase():
+        ptype = _phase_type(b, p)
+        if ptype == PT.vaporPhase:
             return get_method(b, "entr_mol_ig_comp", j)(
                 b, cobj(b, j), b.temperature
             ) - Ideal.gas_constant(b) * log(
                 b.get_mole_frac(p)[p, j] * b.pressure / b.params.pressure_ref
             )
-        elif pobj.is_liquid_phase():
+        elif ptype == PT.liquidPhase:
             # Assume no pressure/volume dependency of entropy for ideal liquids
             return get_method(b, "entr_mol_liq_comp", j)(b, cobj(b, j), b.temperature)
-        elif pobj.is_solid_phase():
+        elif ptype == PT.solidPhase:
             # Assume no pressure/volume dependency of entropy for ideal solids
             return get_method(b, "entr_mol_sol_comp", j)(b, cobj(b, j), b.temperature)
         else:
@@ -248,21 +249,20 @@ class Ideal(EoSBase):
 
     @staticmethod
     def log_fug_phase_comp_eq(b, p, j, pp):
-        pobj = b.params.get_phase(p)
+        ptype = _phase_type(b, p)
 
-        if pobj.is_vapor_phase():
+        if ptype == PT.vaporPhase:
             return log(b.get_mole_frac(p)[p, j]) + log(b.pressure)
-        elif pobj.is_liquid_phase():
-            if (
-                cobj(b, j).config.henry_component is not None
-                and p in cobj(b, j).config.henry_component
-            ):
+        elif ptype == PT.liquidPhase:
+            c = cobj(b, j)
+            T = b.temperature
+            if c.config.henry_component is not None and p in c.config.henry_component:
                 # Use Henry's Law
-                return log_henry_pressure(b, p, j, b.temperature)
-            elif cobj(b, j).config.has_vapor_pressure:
+                return log_henry_pressure(b, p, j, T)
+            elif c.config.has_vapor_pressure:
                 # Use Raoult's Law
                 return log(b.get_mole_frac(p)[p, j]) + log(
-                    get_method(b, "pressure_sat_comp", j)(b, cobj(b, j), b.temperature)
+                    get_method(b, "pressure_sat_comp", j)(b, c, T)
                 )
             else:
                 return Expression.Skip
@@ -271,15 +271,15 @@ class Ideal(EoSBase):
 
     @staticmethod
     def fug_coeff_phase_comp(b, p, j):
-        pobj = b.params.get_phase(p)
-        if not (pobj.is_vapor_phase() or pobj.is_liquid_phase()):
+        ptype = _phase_type(b, p)
+        if ptype not in (PT.vaporPhase, PT.liquidPhase):
             raise PropertyNotSupportedError(_invalid_phase_msg(b.name, p))
         return 1
 
     @staticmethod
     def fug_coeff_phase_comp_eq(b, p, j, pp):
-        pobj = b.params.get_phase(p)
-        if not (pobj.is_vapor_phase() or pobj.is_liquid_phase()):
+        ptype = _phase_type(b, p)
+        if ptype not in (PT.vaporPhase, PT.liquidPhase):
             raise PropertyNotSupportedError(_invalid_phase_msg(b.name, p))
         return 1
 
@@ -289,11 +289,11 @@ class Ideal(EoSBase):
     # don't return Henry pressures at bubble/dew mole fractions
     @staticmethod
     def log_fug_phase_comp_Tbub(b, p, j, pp):
-        pobj = b.params.get_phase(p)
+        ptype = _phase_type(b, p)
         cobj = b.params.get_component(j)
-        if pobj.is_vapor_phase():
+        if ptype == PT.vaporPhase:
             return log(b._mole_frac_tbub[pp[0], pp[1], j]) + log(b.pressure)
-        elif pobj.is_liquid_phase():
+        elif ptype == PT.liquidPhase:
             if (
                 cobj.config.henry_component is not None
                 and p in cobj.config.henry_component
@@ -314,11 +314,11 @@ class Ideal(EoSBase):
 
     @staticmethod
     def log_fug_phase_comp_Tdew(b, p, j, pp):
-        pobj = b.params.get_phase(p)
+        ptype = _phase_type(b, p)
         cobj = b.params.get_component(j)
-        if pobj.is_vapor_phase():
+        if ptype == PT.vaporPhase:
             return log(b.mole_frac_comp[j]) + log(b.pressure)
-        elif pobj.is_liquid_phase():
+        elif ptype == PT.liquidPhase:
             if (
                 cobj.config.henry_component is not None
                 and p in cobj.config.henry_component
@@ -339,11 +339,11 @@ class Ideal(EoSBase):
 
     @staticmethod
     def log_fug_phase_comp_Pbub(b, p, j, pp):
-        pobj = b.params.get_phase(p)
+        ptype = _phase_type(b, p)
         cobj = b.params.get_component(j)
-        if pobj.is_vapor_phase():
+        if ptype == PT.vaporPhase:
             return log(b._mole_frac_pbub[pp[0], pp[1], j]) + log(b.pressure_bubble[pp])
-        elif pobj.is_liquid_phase():
+        elif ptype == PT.liquidPhase:
             if (
                 cobj.config.henry_component is not None
                 and p in cobj.config.henry_component
@@ -356,11 +356,11 @@ class Ideal(EoSBase):
 
     @staticmethod
     def log_fug_phase_comp_Pdew(b, p, j, pp):
-        pobj = b.params.get_phase(p)
+        ptype = _phase_type(b, p)
         cobj = b.params.get_component(j)
-        if pobj.is_vapor_phase():
+        if ptype == PT.vaporPhase:
             return log(b.mole_frac_comp[j]) + log(b.pressure_dew[pp])
-        elif pobj.is_liquid_phase():
+        elif ptype == PT.liquidPhase:
             if (
                 cobj.config.henry_component is not None
                 and p in cobj.config.henry_component
@@ -375,10 +375,10 @@ class Ideal(EoSBase):
 
     @staticmethod
     def gibbs_mol_phase(b, p):
-        return sum(
-            b.get_mole_frac(p)[p, j] * b.gibbs_mol_phase_comp[p, j]
-            for j in b.components_in_phase(p)
-        )
+        # Equal to sum(x[p, j]*gibbs_mol_phase_comp[p, j]) when the phase mole
+        # fractions sum to one. Otherwise the (P - Pref)/dens_mol_phase term in
+        # the liquid and solid enthalpies is weighted by sum(x) in the latter
+        return b.enth_mol_phase[p] - b.entr_mol_phase[p] * b.temperature
 
     @staticmethod
     def gibbs_mol_phase_comp(b, p, j):
@@ -407,48 +407,77 @@ class Ideal(EoSBase):
 
     @staticmethod
     def vol_mol_phase(b, p):
-        pobj = b.params.get_phase(p)
-        if pobj.is_vapor_phase():
+        ptype = _phase_type(b, p)
+        if ptype == PT.vaporPhase:
             return Ideal.gas_constant(b) * b.temperature / b.pressure
-        elif pobj.is_liquid_phase():
-            ptype = "liq"
-        elif pobj.is_solid_phase():
-            ptype = "sol"
+        elif ptype == PT.liquidPhase:
+            suffix = "liq"
+        elif ptype == PT.solidPhase:
+            suffix = "sol"
         else:
             raise PropertyNotSupportedError(_invalid_phase_msg(b.name, p))
 
+        x = b.get_mole_frac(p)
+        T = b.temperature
         v_expr = 0
         for j in b.components_in_phase(p):
             # First try to get a method for vol_mol
-            v_comp = Ideal.get_vol_mol_pure(b, ptype, j, b.temperature)
-            v_expr += b.get_mole_frac(p)[p, j] * v_comp
+            v_comp = Ideal.get_vol_mol_pure(b, suffix, j, T)
+            v_expr += x[p, j] * v_comp
 
         return v_expr
 
 
+def _phase_type(b, p):
+    """
+    Return the PhaseType (vapor, liquid or solid) of phase p, or None.
+
+    Results are cached on the parameter block, so each phase object is only
+    inspected once regardless of how many state blocks use it.
+    """
+    try:
+        cache = b.params._ideal_phase_type
+    except AttributeError:
+        cache = b.params._ideal_phase_type = {}
+    try:
+        return cache[p]
+    except KeyError:
+        pass
+
+    pobj = b.params.get_phase(p)
+    if pobj.is_vapor_phase():
+        ptype = PT.vaporPhase
+    elif pobj.is_liquid_phase():
+        ptype = PT.liquidPhase
+    elif pobj.is_solid_phase():
+        ptype = PT.solidPhase
+    else:
+        ptype = None
+    cache[p] = ptype
+    return ptype
+
+
 def _invalid_phase_msg(name, phase):
     return (
-        "{} received unrecognised phase name {}. Ideal property "
-        "library only supports Vap and Liq phases.".format(name, phase)
+        f"{name} received unrecognised phase name {phase}. Ideal property "
+        "library only supports Vap and Liq phases."
     )
 
 
 def _fug_phase_comp(b, p, j, T):
-    pobj = b.params.get_phase(p)
+    ptype = _phase_type(b, p)
 
-    if pobj.is_vapor_phase():
+    if ptype == PT.vaporPhase:
         return b.get_mole_frac(p)[p, j] * b.pressure
-    elif pobj.is_liquid_phase():
-        if (
-            cobj(b, j).config.henry_component is not None
-            and p in cobj(b, j).config.henry_component
-        ):
+    elif ptype == PT.liquidPhase:
+        c = cobj(b, j)
+        if c.config.henry_component is not None and p in c.config.henry_component:
             # Use Henry's Law
             return henry_pressure(b, p, j, T)
-        elif cobj(b, j).config.has_vapor_pressure:
+        elif c.config.has_vapor_pressure:
             # Use Raoult's Law
             return b.get_mole_frac(p)[p, j] * get_method(b, "pressure_sat_comp", j)(
-                b, cobj(b, j), T
+                b, c, T
             )
         else:
             return Expression.Skip
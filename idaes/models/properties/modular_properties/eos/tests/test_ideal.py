@@ -18,7 +18,7 @@ Author: Andrew Lee
 import pytest
 from sys import modules
 
-from pyomo.environ import ConcreteModel, Var, units as pyunits, value
+from pyomo.environ import ConcreteModel, Expression, Var, units as pyunits, value
 from pyomo.util.check_units import assert_units_equivalent
 
 from idaes.core import (
@@ -29,8 +29,9 @@ from idaes.core import (
     Solute,
     Solvent,
     Apparent,
+    PhaseType as PT,
 )
-from idaes.models.properties.modular_properties.eos.ideal import Ideal
+from idaes.models.properties.modular_properties.eos.ideal import Ideal, _phase_type
 from idaes.models.properties.modular_properties.base.generic_property import (
     GenericParameterData,
 )
@@ -142,6 +143,17 @@ def test_common(m):
     assert Ideal.common(m.props, "foo") is None
 
 
+@pytest.mark.unit
+def test_phase_type(m, m_sol):
+    assert _phase_type(m.props[1], "Vap") == PT.vaporPhase
+    assert _phase_type(m.props[1], "Liq") == PT.liquidPhase
+    assert _phase_type(m_sol.props[1], "Sol") == PT.solidPhase
+
+    # Results should be cached on the parameter block
+    assert m.params._ideal_phase_type == {"Vap": PT.vaporPhase, "Liq": PT.liquidPhase}
+    assert m_sol.params._ideal_phase_type == {"Sol": PT.solidPhase}
+
+
 @pytest.mark.unit
 def test_compress_fact_phase_Liq(m):
     assert Ideal.compress_fact_phase(m.props[1], "Liq") == 0
@@ -513,15 +525,53 @@ def test_fug_coeff_phase_comp_invalid_phase(m_sol):
 
 @pytest.mark.unit
 def test_gibbs_mol_phase(m):
-    m.props[1].gibbs_mol_phase_comp = Var(m.params.phase_list, m.params.component_list)
+    m.props[1].enth_mol_phase = Var(m.params.phase_list)
+    m.props[1].entr_mol_phase = Var(m.params.phase_list)
 
     for p in m.params.phase_list:
         assert str(Ideal.gibbs_mol_phase(m.props[1], p)) == str(
-            sum(
-                m.props[1].mole_frac_phase_comp[p, j]
-                * m.props[1].gibbs_mol_phase_comp[p, j]
-                for j in m.params.component_list
-            )
+            m.props[1].enth_mol_phase[p]
+            - m.props[1].entr_mol_phase[p] * m.props[1].temperature
+        )
+
+
+@pytest.mark.unit
+def test_gibbs_mol_phase_value(m):
+    # On the simplex, the phase Gibbs energy should match the mole fraction
+    # weighted sum of the component Gibbs energies
+    for j in m.params.component_list:
+        m.params.get_component(j).config.enth_mol_liq_comp = dummy_call
+        m.params.get_component(j).config.enth_mol_ig_comp = dummy_call
+        m.params.get_component(j).config.entr_mol_liq_comp = dummy_call2
+        m.params.get_component(j).config.entr_mol_ig_comp = dummy_call2
+
+    b = m.props[1]
+    b.dens_mol_phase = Var(m.params.phase_list, initialize=50)
+    for p in m.params.phase_list:
+        for j, x in zip(m.params.component_list, [0.2, 0.3, 0.5]):
+            b.mole_frac_phase_comp[p, j].value = x
+
+    b.enth_mol_phase_comp = Expression(
+        m.params.phase_list, m.params.component_list, rule=Ideal.enth_mol_phase_comp
+    )
+    b.entr_mol_phase_comp = Expression(
+        m.params.phase_list, m.params.component_list, rule=Ideal.entr_mol_phase_comp
+    )
+    b.gibbs_mol_phase_comp = Expression(
+        m.params.phase_list, m.params.component_list, rule=Ideal.gibbs_mol_phase_comp
+    )
+    b.enth_mol_phase = Expression(m.params.phase_list, rule=Ideal.enth_mol_phase)
+    b.entr_mol_phase = Expression(m.params.phase_list, rule=Ideal.entr_mol_phase)
+
+    for p in m.params.phase_list:
+        assert value(Ideal.gibbs_mol_phase(b, p)) == pytest.approx(
+            value(
+                sum(
+                    b.mole_frac_phase_comp[p, j] * b.gibbs_mol_phase_comp[p, j]
+                    for j in m.params.component_list
+                )
+            ),
+            rel=1e-12,
         )
 
 